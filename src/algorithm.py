@@ -6,7 +6,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import fsum
+from operator import attrgetter
 from typing import Callable, Iterable, Optional, Sequence
 
 from arch_model import Architecture, Core
@@ -25,7 +25,27 @@ def _local_check_edf(cores: Sequence[Core], tasks: Sequence[Task], security_marg
 		A `Problem`.
 	"""
 
-	return _local_check(fsum(task.workload for task in tasks), len(cores) * security_margin)
+	return _local_check(sum(task.workload for task in tasks), len(cores) * security_margin)
+
+
+def _liu_layland_bound(task_count: int) -> float:
+	"""Returns the Liu & Layland utilization bound for a number of tasks, precomputed for up to 1024 tasks.
+
+	Parameters
+	----------
+	task_count : int
+		A number of tasks.
+
+	Returns
+	-------
+	float
+		The utilization bound `n * (2^(1/n) - 1)`, or `0.0` if there are no tasks.
+	"""
+
+	if task_count < len(liu_layland_bounds):
+		return liu_layland_bounds[task_count]
+	else:
+		return task_count * (2**(1 / task_count) - 1)
 
 
 def _local_check_rm(cores: Sequence[Core], tasks: Sequence[Task], security_margin: float) -> SchedCheckResult:
@@ -38,8 +58,8 @@ def _local_check_rm(cores: Sequence[Core], tasks: Sequence[Task], security_margi
 	"""
 
 	return _local_check(
-		fsum(task.workload for task in tasks),
-		len(cores) * security_margin * (len(tasks) * (2**(1 / len(tasks)) - 1)),
+		sum(task.workload for task in tasks),
+		len(cores) * security_margin * _liu_layland_bound(len(tasks)),
 	)
 
 
@@ -55,7 +75,7 @@ def _local_check(total_workload: float, sufficient_condition: float) -> SchedChe
 """Scheduling check, returns the sufficient condition."""
 SchedCheckResult = Optional[tuple[float, float]]
 SchedChecker = Callable[[Sequence[Core], Sequence[Task], float], SchedCheckResult]
-Scheduler = Callable[[Iterable[Job]], Iterable[Job]]
+Scheduler = Callable[[Iterable[Job]], list[Job]]
 
 
 @dataclass
@@ -65,12 +85,12 @@ class SchedAlgorithm:
 	local_scheduling_check: SchedChecker
 	scheduler: Scheduler
 
-	def __call__(self: SchedAlgorithm, jobs: Iterable[Job]) -> Iterable[Job]:
+	def __call__(self: SchedAlgorithm, jobs: Iterable[Job]) -> list[Job]:
 		return self.scheduler(jobs)
 
 	def global_scheduling_check(self: SchedAlgorithm, arch: Architecture, graph: Graph) -> SchedCheckResult:
 		return self.local_scheduling_check(
-			[core for cpu in arch for core in cpu], [task for app in graph for task in app], self.security_margin,
+			[core for cpu in arch for core in cpu], graph.tasks, self.security_margin,
 		)
 
 	def core_scheduling_check(self: SchedAlgorithm, core: Core) -> bool:
@@ -79,17 +99,23 @@ class SchedAlgorithm:
 
 # DATA ################################################################################################################
 
+"""Liu & Layland utilization bounds, by number of tasks."""
+liu_layland_bounds: tuple[float, ...] = (0.0,) + tuple(n * (2**(1 / n) - 1) for n in range(1, 1025))
+
+"""Scheduling algorithms, by short name.
+The workloads are summed with `sum()` rather than `fsum()`:
+their rounding error is negligible next to the security margin."""
 algorithms: dict[str, SchedAlgorithm] = {
 	"edf": SchedAlgorithm(
 		"Earliest Deadline First",
 		0.9,
 		_local_check_edf,
-		lambda jobs: sorted(jobs, key=lambda job: job.exec_window.stop),
+		lambda jobs: sorted(jobs, key=attrgetter("exec_window.stop")),
 	),
 	"rm": SchedAlgorithm(
 		"Rate monotonic",
 		0.9,
 		_local_check_rm,
-		lambda jobs: sorted(jobs, key=lambda job: job.task.period),
+		lambda jobs: sorted(jobs, key=attrgetter("task.period")),
 	),
 }
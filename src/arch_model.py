@@ -5,36 +5,124 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Reversible, Set
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from functools import total_ordering
-from math import fsum
+from typing import Any, Optional, SupportsIndex
 
 from graph_model import App, Job, Task
 
-from sortedcontainers import SortedSet  # type: ignore
-
 
 # CLASSES AND TYPE ALIASES ############################################################################################
 
-@dataclass
-@total_ordering
-class Core(Set, Reversible):
+class TaskList(list[Task]):
+	"""A list of tasks caching the sum of their workloads, invalidated whenever the list is mutated.
+
+	Attributes
+	----------
+	_workload : Optional[float]
+		The cached workload sum, or `None` if it has to be recomputed.
+	"""
+
+	_workload: Optional[float] = None
+
+	def workload(self: TaskList) -> float:
+		"""Computes and caches the workload of the tasks.
+
+		Parameters
+		----------
+		self : TaskList
+			The instance of `TaskList`.
+
+		Returns
+		-------
+		float
+			The workload sum of all tasks in the list.
+		"""
+
+		if self._workload is None:
+			self._workload = sum(task.workload for task in self)
+
+		return self._workload
+
+	def copy(self: TaskList) -> TaskList:
+		"""Creates a shallow copy of the list, keeping the cached workload.
+
+		Parameters
+		----------
+		self : TaskList
+			The instance of `TaskList`.
+
+		Returns
+		-------
+		TaskList
+			A new list holding the same tasks.
+		"""
+
+		result = TaskList(self)
+		result._workload = self._workload
+
+		return result
+
+	# MUTABLE SEQUENCE
+
+	def append(self: TaskList, task: Task) -> None:
+		self._workload = None
+		super().append(task)
+
+	def extend(self: TaskList, tasks: Iterable[Task]) -> None:
+		self._workload = None
+		super().extend(tasks)
+
+	def insert(self: TaskList, index: SupportsIndex, task: Task) -> None:
+		self._workload = None
+		super().insert(index, task)
+
+	def remove(self: TaskList, task: Task) -> None:
+		self._workload = None
+		super().remove(task)
+
+	def pop(self: TaskList, index: SupportsIndex = -1) -> Task:
+		self._workload = None
+		return super().pop(index)
+
+	def clear(self: TaskList) -> None:
+		self._workload = None
+		super().clear()
+
+	def __setitem__(self: TaskList, key: Any, value: Any) -> None:
+		self._workload = None
+		super().__setitem__(key, value)
+
+	def __delitem__(self: TaskList, key: Any) -> None:
+		self._workload = None
+		super().__delitem__(key)
+
+	def __iadd__(self: TaskList, tasks: Iterable[Task]) -> TaskList:  # type: ignore
+		self._workload = None
+		return super().__iadd__(tasks)
+
+	def __imul__(self: TaskList, count: SupportsIndex) -> TaskList:  # type: ignore
+		self._workload = None
+		return super().__imul__(count)
+
+
+@dataclass(slots=True)
+class Core:
 	"""Represents a core.
 
 	Attributes
 	----------
 	id : int
 		The core id within a `Processor`.
-	processor : Processor
-		The processor this core belongs to.
-	tasks : SortedSet[Task]
-		The tasks attached to this core, sorted by criticality.
+	processor_id : int
+		The id of the processor this core belongs to.
+	tasks : TaskList
+		The tasks attached to this core.
 	"""
 
 	id: int
-	processor: Processor
-	tasks: list[Task] = field(compare=False, default_factory=list) #pqueue
+	processor_id: int
+	tasks: TaskList = field(compare=False, default_factory=TaskList) #pqueue
 
 	def workload(self: Core) -> float:
 		"""The workload of the core.
@@ -50,7 +138,23 @@ class Core(Set, Reversible):
 			The workload sum of all tasks on this core.
 		"""
 
-		return fsum(task.workload for task in self) if self.tasks else 0.0
+		return self.tasks.workload()
+
+	def clone(self: Core) -> Core:
+		"""Creates a copy of the core with its own list of tasks, the tasks themselves are shared.
+
+		Parameters
+		----------
+		self : Core
+			The instance of `Core`.
+
+		Returns
+		-------
+		Core
+			The copy of the core.
+		"""
+
+		return Core(self.id, self.processor_id, self.tasks.copy())
 
 	def short(self: Core) -> str:
 		"""A short description of a core.
@@ -66,7 +170,7 @@ class Core(Set, Reversible):
 			The short description.
 		"""
 
-		return f"{self.processor.id} / {self.id} : {self.workload()}"
+		return f"{self.processor_id} / {self.id} : {self.workload()}"
 
 	def pformat(self: Core, level: int = 0) -> str:
 		"""A complete description of a core.
@@ -84,14 +188,14 @@ class Core(Set, Reversible):
 			The complete description.
 		"""
 
-		return ("\n" + ("\t" * level) + f"core {{ id : {self.id}; processor : {self.processor.id}; workload: {self.workload}; }}")
+		return ("\n" + ("\t" * level) + f"core {{ id : {self.id}; processor : {self.processor_id}; workload: {self.workload}; }}")
 
 	# HASHABLE
 
 	def __hash__(self: Core) -> int:
-		return hash(str(self.id) + str(self.processor.id))
+		return hash((self.id, self.processor_id))
 
-	# TOTAL ORDERING
+	# ORDERING
 
 	def __lt__(self: Core, other: object) -> bool:
 		if isinstance(other, Core):
@@ -99,7 +203,7 @@ class Core(Set, Reversible):
 		else:
 			return NotImplemented
 
-	# SET
+	# CONTAINER
 
 	def __contains__(self: Core, item: object) -> bool:
 		if isinstance(item, Task):
@@ -121,36 +225,31 @@ class Core(Set, Reversible):
 		return self.tasks.__reversed__()
 
 	# DEEPCOPY
+
 	def __deepcopy__(self: Core, memo: dict[int, object]) -> Core:
-		cls = self.__class__
-		result = cls.__new__(cls)
+		result = self.clone()
 		memo[id(self)] = result
 
-		result.id = self.id
-		result.processor = self.processor
-		result.tasks = self.tasks
-
 		return result
 
 
-@dataclass
-@total_ordering
-class Processor(Set, Reversible):
+@dataclass(slots=True)
+class Processor:
 	"""Represents a processor.
 
 	Attributes
 	----------
 	id : int
 		The processor within an `Architecture`.
-	cores : SortedSet[Core]
-		The set containing the `Core` objects within the Processor.
-	apps : SortedSet[App]
+	cores : list[Core]
+		The list containing the `Core` objects within the Processor.
+	apps : list[App]
 		Applications to be scheduled on the Processor.
 	"""
 
 	id: int
-	cores: SortedSet[Core] = field(compare=False, default_factory=SortedSet)
-	apps: SortedSet[App] = field(compare=False, default_factory=SortedSet)
+	cores: list[Core] = field(compare=False, default_factory=list)
+	apps: list[App] = field(compare=False, default_factory=list)
 
 	def workload(self: Processor) -> float:
 		"""The workload of the processor.
@@ -166,7 +265,7 @@ class Processor(Set, Reversible):
 			The sum of workload of all cores on this processor.
 		"""
 
-		return fsum(core.workload() for core in self) if self.cores else 0.0
+		return sum(core.workload() for core in self) if self.cores else 0.0
 
 	def min_core(self: Processor) -> Core:
 		"""The core on the processor with the lowest workload.
@@ -207,9 +306,9 @@ class Processor(Set, Reversible):
 	# HASHABLE
 
 	def __hash__(self: Processor) -> int:
-		return hash(str(self.id))
+		return hash(self.id)
 
-	# TOTAL ORDERING
+	# ORDERING
 
 	def __lt__(self: Processor, other: object) -> bool:
 		if isinstance(other, Processor):
@@ -217,7 +316,7 @@ class Processor(Set, Reversible):
 		else:
 			return NotImplemented
 
-	# SET
+	# CONTAINER
 
 	def __contains__(self: Processor, item: object) -> bool:
 		if isinstance(item, Core):
@@ -239,8 +338,8 @@ class Processor(Set, Reversible):
 		return self.cores.__reversed__()
 
 
-"""An set of `Processor` representing an `Architecture`."""
-Architecture = set[Processor]
+"""A list of `Processor` representing an `Architecture`."""
+Architecture = list[Processor]
 
 """Maps a core to a set of tasks."""
 CoreTaskMap = dict[Core, list[Task]]
@@ -5,8 +5,13 @@
 
 
 import logging
+from collections.abc import Iterator
+from functools import lru_cache
+from itertools import pairwise
 from math import lcm
+from operator import itemgetter
 from pathlib import Path
+from xml.etree.ElementTree import Element
 
 from arch_model import Architecture, Core, Processor
 
@@ -14,11 +19,28 @@ from defusedxml import ElementTree  # type: ignore
 
 from graph_model import App, Criticality, Graph, Job, Task
 
+try:
+	from lxml.etree import iterparse as lxml_iterparse  # type: ignore
+except ImportError:
+	lxml_iterparse = None
+
 from model import Configuration, Problem
 
 from timed import timed_callable
 
 
+# TYPE ALIASES ########################################################################################################
+
+"""The id, WCET, period, deadline and criticality of a task node."""
+NodeAttributes = tuple[int, int, int, int, Criticality]
+
+"""The name, order and runnable names of an application."""
+AppAttributes = tuple[str, bool, tuple[str, ...]]
+
+"""The modification time, in nanoseconds, and the size of a file."""
+FileVersion = tuple[int, int]
+
+
 # FUNCTIONS ###########################################################################################################
 
 
@@ -37,6 +59,102 @@ def _print_jobs(graph: Graph) -> None:
 				print(job.pformat())
 
 
+def _get_version(filepath: Path) -> FileVersion:
+	"""Gets the version of a file, used as part of the key of the parsing caches.
+
+	Parameters
+	----------
+	filepath : Path
+		A `Path` to a file.
+
+	Returns
+	-------
+	FileVersion
+		The modification time, in nanoseconds, and the size of the file.
+	"""
+
+	stat = filepath.stat()
+
+	return stat.st_mtime_ns, stat.st_size
+
+
+def _stream(filepath: Path, tags: frozenset[str]) -> Iterator[Element]:
+	"""Streams the complete elements with the given tags from an XML file.
+	Each yielded element is cleared and detached from its parent afterwards, so that the tree never grows.
+	The C parser of `lxml` is used when it is installed, with entity resolution, DTD loading and network access
+	disabled, and comments and processing instructions dropped as `defusedxml` does; otherwise the file is parsed with
+	`defusedxml`.
+
+	Parameters
+	----------
+	filepath : Path
+		A `Path` to an XML file.
+	tags : frozenset[str]
+		The tags of the elements to yield.
+
+	Yields
+	------
+	Element
+		The elements with one of the given tags, in document order, once their end tag has been parsed.
+	"""
+
+	parents: list[Element] = []
+
+	if lxml_iterparse is not None:
+		events = lxml_iterparse(
+			str(filepath),
+			events=("start", "end"),
+			resolve_entities=False,
+			load_dtd=False,
+			no_network=True,
+			remove_comments=True,
+			remove_pis=True,
+		)
+	else:
+		events = ElementTree.iterparse(filepath, events=("start", "end"))
+
+	for event, element in events:
+		if event == "start":
+			parents.append(element)
+		else:
+			parents.pop()
+
+			if element.tag in tags:
+				yield element
+
+				element.clear()
+
+				if parents:
+					del parents[-1][-1]
+
+
+@lru_cache(maxsize=32)
+def _parse_arch(filepath: Path, version: FileVersion) -> tuple[tuple[int, tuple[int, ...]], ...]:
+	"""Parses and caches the processor and core ids from an architecture file.
+
+	Parameters
+	----------
+	filepath : Path
+		A `Path` to a *.cfg* file representing the processor architecture.
+	version : FileVersion
+		The version of the file, so that a modified file is parsed again.
+
+	Returns
+	-------
+	tuple[tuple[int, tuple[int, ...]], ...]
+		The processor ids, each along with the ids of its cores, all sorted by id.
+	"""
+
+	cpus: list[tuple[int, tuple[int, ...]]] = []
+
+	for cpu in _stream(filepath, frozenset({"Cpu"})):
+		cpus.append((int(cpu.attrib["Id"]), tuple(sorted(int(core.attrib["Id"]) for core in cpu))))
+
+	cpus.sort(key=itemgetter(0))
+
+	return tuple(cpus)
+
+
 def _import_arch(filepath: Path) -> Architecture:
 	"""Returns an architecture extracted from a architecture file.
 
@@ -48,33 +166,48 @@ def _import_arch(filepath: Path) -> Architecture:
 	Returns
 	-------
 	Architecture
-		An set of `Processor`.
+		A list of `Processor`.
 	"""
 
-	arch: list[Processor] = []
+	arch: Architecture = []
 
-	for cpu in ElementTree.parse(filepath).iter("Cpu"):
-		arch.append(Processor(int(cpu.get("Id"))))
-		arch[-1].cores = {Core(int(core.get("Id")), arch[-1]) for core in cpu}
+	for cpu_id, core_ids in _parse_arch(filepath, _get_version(filepath)):
+		arch.append(Processor(cpu_id))
+		arch[-1].cores = [Core(core_id, cpu_id) for core_id in core_ids]
 
-	return set(arch)
+	return arch
 
 
-def _compute_hyperperiod(apps: list[App]) -> int:
-	"""Computes the hyperperiod from a list of apps.
+def _get_periods(apps: list[App]) -> set[int]:
+	"""Gathers the distinct task periods from a list of apps.
 
 	Parameters
 	----------
 	apps : list[App]
-		Applications to compute a hyperperiod for.
+		Applications to gather the periods from.
 
 	Returns
 	-------
-	int
-		The hyperperiod for the apps.
+	set[int]
+		The distinct periods of the tasks within the apps.
 	"""
 
-	periods = {task.period for app in apps for task in app}
+	return {task.period for app in apps for task in app}
+
+
+def _compute_hyperperiod(periods: set[int]) -> int:
+	"""Computes the hyperperiod from a set of periods.
+
+	Parameters
+	----------
+	periods : set[int]
+		Distinct task periods to compute a hyperperiod for.
+
+	Returns
+	-------
+	int
+		The hyperperiod for the periods.
+	"""
 
 	return lcm(*periods)
 
@@ -98,14 +231,58 @@ def _create_jobs(apps: list[App], hyperperiod: int) -> list[App]:
 
 	for app in apps:
 		for task in app:
-			for i in range(int(hyperperiod / task.period)):
-				start = i * task.period
-				window = slice(start, start + task.deadline)
-				task.jobs.append(Job(task, window, window))
+			deadline = task.deadline
+			windows = (slice(start, start + deadline) for start in range(0, hyperperiod, task.period))
+			task.jobs = [Job(task, window, window) for window in windows]
 
 	return apps
 
 
+@lru_cache(maxsize=32)
+def _parse_graph(filepath: Path, version: FileVersion) -> tuple[dict[str, NodeAttributes], tuple[AppAttributes, ...]]:
+	"""Parses and caches the nodes and applications from a tasks file.
+	The returned values are shared between calls and must not be modified.
+
+	Parameters
+	----------
+	filepath : Path
+		A `Path` to a *.tsk* file representing the task graph.
+	version : FileVersion
+		The version of the file, so that a modified file is parsed again.
+
+	Returns
+	-------
+	nodes : dict[str, NodeAttributes]
+		The attributes of the nodes, by name.
+	applications : tuple[AppAttributes, ...]
+		The attributes of the applications.
+	"""
+
+	nodes: dict[str, NodeAttributes] = {}
+	applications: list[AppAttributes] = []
+
+	# single streaming pass, the applications are only built once all the nodes are known
+	for element in _stream(filepath, frozenset({"Node", "Application"})):
+		attributes = element.attrib
+
+		if element.tag == "Node":
+			nodes[attributes["Name"]] = (
+				int(attributes["Id"]),
+				int(attributes["WCET"]),
+				int(element.find("Period").attrib["Value"]),
+				int(attributes["Deadline"]),
+				criticalities[int(attributes["CIL"])],
+			)
+		else:
+			applications.append((
+				attributes["Name"],
+				attributes.get("Inorder") == "true",
+				tuple(runnable.attrib["Name"] for runnable in element.iter("Runnable")),
+			))
+
+	return nodes, tuple(applications)
+
+
 def _import_graph(filepath: Path) -> Graph:
 	"""Creates the graph from the tasks file, then returns it.
 
@@ -120,34 +297,26 @@ def _import_graph(filepath: Path) -> Graph:
 		An app graph.
 	"""
 
-	et = ElementTree.parse(filepath)
-	nodes = {node.get("Name"): node for node in et.iter("Node")}
+	nodes, applications = _parse_graph(filepath, _get_version(filepath))
 	apps: list[App] = []
 
-	for app in et.iter("Application"):
-		apps.append(App(app.get("Name"), False))
+	for name, inorder, runnables in applications:
+		apps.append(App(name, False))
 
 		tasks = [
-			Task(
-				int(node.get("Id")),
-				apps[-1],
-				int(node.get("WCET")),
-				int(node.find("Period").get("Value")),
-				int(node.get("Deadline")),
-				Criticality(int(node.get("CIL"))),
-				None,
-			) for runnable in app.iter("Runnable") if (node := nodes.get(runnable.get("Name"))) is not None
+			Task(_id, apps[-1], wcet, period, deadline, criticality, None)
+			for _id, wcet, period, deadline, criticality in filter(None, map(nodes.get, runnables))
 		]
 
-		if app.get("Inorder") == "true":
+		if inorder:
 			apps[-1].order = True
 
-			for i, task in enumerate(tasks[1:]):
-				task.parent = tasks[i]
+			for parent, task in pairwise(tasks):
+				task.parent = parent
 
 		apps[-1].tasks = tasks
 
-	hyperperiod = _compute_hyperperiod(apps)
+	hyperperiod = _compute_hyperperiod(_get_periods(apps))
 
 	return Graph(_create_jobs(apps, hyperperiod), hyperperiod)
 
@@ -182,3 +351,9 @@ def build(config: Configuration) -> Problem:
 	# _print_jobs(graph)
 
 	return Problem(config, arch, graph)
+
+
+# DATA ################################################################################################################
+
+"""Maps the criticality levels found in the task files to `Criticality` members."""
+criticalities: dict[int, Criticality] = {int(criticality): criticality for criticality in Criticality}
@@ -5,19 +5,23 @@
 
 
 from enum import Enum, unique
-from functools import partial
-from itertools import accumulate
-from json import JSONEncoder, dumps
-from queue import PriorityQueue
-from typing import Any
-from xml.etree.ElementTree import Element, SubElement, dump, indent, register_namespace, tostring
+from functools import lru_cache, partial
+from html import escape
+from itertools import accumulate, groupby
+from json import JSONEncoder, dump, dumps
+from typing import Any, Callable, Iterator, Optional, TextIO
 
 from arch_model import Core, CoreJobMap
 
-from graph_model import Criticality, Job
+from graph_model import Job
 
 from model import Path, Solution
 
+try:
+	import orjson  # type: ignore
+except ImportError:
+	orjson = None
+
 from timed import timed_callable
 
 
@@ -34,44 +38,103 @@ class SolutionEncoder(JSONEncoder):
 	"""
 
 	def default(self: JSONEncoder, obj: Any) -> Any:
-		if isinstance(obj, PriorityQueue):
-			return [obj.qsize(), obj.empty()]
-		elif isinstance(obj, Solution):
-			return {"schedule": {
-				"configuration": obj.problem.config.json(),
-				"hyperperiod": obj.problem.graph.hyperperiod,
-				"score": obj.score,
-				"core_jobs": obj.core_jobs,
-			}}
-		elif isinstance(obj, Path):
-			return str(obj)
-
-		return JSONEncoder.default(self, obj)  # Let the base class default method raise the TypeError
+		return _encode(obj)
 
 
 # FUNCTIONS ###########################################################################################################
 
 
+def _encode(obj: Any) -> Any:
+	"""Converts an object that is not natively serializable into JSON-compatible values.
+
+	Parameters
+	----------
+	obj : Any
+		An object to serialize.
+
+	Returns
+	-------
+	Any
+		A JSON-compatible representation of the object.
+
+	Raises
+	------
+	TypeError
+		If the type of the object is not handled.
+	"""
+
+	handler = encoders.get(type(obj))
+
+	if handler is None:
+		# subclasses, such as the concrete flavours of `Path`, are resolved once through their MRO
+		handler = next((encoders[cls] for cls in type(obj).__mro__ if cls in encoders), None)
+
+		if handler is None:
+			raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+		encoders[type(obj)] = handler
+
+	return handler(obj)
+
+
+def _group_core_jobs(core_jobs: CoreJobMap) -> Iterator[tuple[int, Iterator[tuple[Core, list[Job]]]]]:
+	"""Groups the cores and their jobs by processor, both sorted by id.
+
+	Parameters
+	----------
+	core_jobs : CoreJobMap
+		A mapping between cores and jobs.
+
+	Returns
+	-------
+	Iterator[tuple[int, Iterator[tuple[Core, list[Job]]]]]
+		The processor ids, each along with its cores and their jobs.
+	"""
+
+	return groupby(
+		sorted(core_jobs.items(), key=lambda item: (item[0].processor_id, item[0].id)),
+		key=lambda item: item[0].processor_id,
+	)
+
+
 @timed_callable("Formatting the solutions to JSON...")
-def _json_format(solution: Solution) -> str:
+def _json_format(solution: Solution, out: Optional[TextIO] = None) -> str:
 	"""Formats a solution into JSON.
 
 	Parameters
 	----------
 	solution : Solution
 		A `Solution`.
+	out : Optional[TextIO], optional
+		A text stream to which the JSON is written as it is encoded, instead of being returned (default: None).
 
 	Returns
 	-------
 	str
-		A `str` representing a JSON `Solution`.
+		A `str` representing a JSON `Solution`, or an empty `str` if it has been written to `out`.
 	"""
 
-	return dumps(solution, skipkeys=True, sort_keys=True, indent=4, cls=SolutionEncoder)
+	if orjson is not None:
+		encoded = orjson.dumps(
+			solution, default=_encode, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+		).decode()
+
+		if out is None:
+			return encoded
+		else:
+			out.write(encoded)
+
+			return ""
+	elif out is None:
+		return dumps(solution, sort_keys=True, indent=2, cls=SolutionEncoder)
+	else:
+		dump(solution, out, sort_keys=True, indent=2, cls=SolutionEncoder)
+
+		return ""
 
 
 @timed_callable("Formatting the solutions to XML...")
-def _xml_format(solution: Solution) -> str:
+def _xml_format(solution: Solution, out: Optional[TextIO] = None) -> str:
 	"""Formats a solution into a custom XML schema.
 	<scheduling>
 		<config algorithm="" switch-time=0 objective="">
@@ -90,55 +153,54 @@ def _xml_format(solution: Solution) -> str:
 	----------
 	solution : Solution
 		A `Solution`.
+	out : Optional[TextIO], optional
+		A text stream to which the XML is written, instead of being returned (default: None).
 
 	Returns
 	-------
 	str
-		A `str` representing a XML `Solution`.
+		A `str` representing a XML `Solution`, or an empty `str` if it has been written to `out`.
 	"""
 
-	scheduling = Element("scheduling")
-	config = SubElement(scheduling, "configuration", {
-		"algorithm": solution.problem.config.params.algorithm,
-		"switch-time": str(solution.problem.config.params.switch_time),
-		"objective": solution.problem.config.params.objective,
-	})
-	config.append(Element("files", {
-		"tsk": str(solution.problem.config.filepaths.tsk),
-		"cfg": str(solution.problem.config.filepaths.cfg),
-	}))
-
-	mapping = SubElement(scheduling, "mapping", {
-		"hyperperiod": str(solution.problem.graph.hyperperiod),
-		"score": str(solution.score),
-	})
-
-	cpus: dict[int, dict[int, list[Job]]] = {}
-
-	for core, jobs in solution.mapping.items():
-		if core.processor.id in cpus:
-			cpus[core.processor.id][core.id] = jobs
-		else:
-			cpus[core.processor.id] = {core.id: jobs}
+	params = solution.problem.config.params
+	filepaths = solution.problem.config.filepaths
+	processors: list[str] = []
+
+	# the document is written as indented text directly, rather than built as a tree then serialized
+	for cpu_id, cores in _group_core_jobs(solution.core_jobs):
+		processors.append(f'\t\t<processor id="cpu-{cpu_id}">\n')
+
+		for core, jobs in cores:
+			if jobs:
+				processors.append(f'\t\t\t<core id="core-{core.id}">\n')
+				processors.extend(
+					f'\t\t\t\t<slice start="{job.exec_window.start}" stop="{job.exec_window.stop}" duration="{job.duration}"'
+					f' app="{_escape_attrib(job.task.app.name)}" task="{job.task.id}" />\n' for job in jobs
+				)
+				processors.append('\t\t\t</core>\n')
+			else:
+				processors.append(f'\t\t\t<core id="core-{core.id}" />\n')
+
+		processors.append('\t\t</processor>\n')
 
-	for cpu_id, cores in cpus.items():
-		cpu = SubElement(mapping, "processor", {"id": f"cpu-{cpu_id}"})
-		for core_id, jobs in cores.items():
-			_core = SubElement(cpu, "core", {"id": f"core-{core_id}"})
-			_core.extend([
-				Element("slice", {
-					"start": str(job.exec_window.start),
-					"stop": str(job.exec_window.stop),
-					"duration": str(job.duration),
-					"app": job.task.app.name,
-					"task": str(job.task.id),
-				}) for job in jobs
-			])
+	mapping = f'\t<mapping hyperperiod="{solution.problem.graph.hyperperiod}" score="{solution.score}"'
 
-	indent(scheduling, space="\t")
-	dump(scheduling)
+	parts = [
+		"<?xml version='1.0' encoding='utf-8'?>\n<scheduling>\n",
+		f'\t<configuration algorithm="{_escape_attrib(params.algorithm)}" switch-time="{params.switch_time}"'
+		f' objective="{_escape_attrib(params.objective)}">\n',
+		f'\t\t<files tsk="{_escape_attrib(str(filepaths.tsk))}" cfg="{_escape_attrib(str(filepaths.cfg))}" />\n',
+		'\t</configuration>\n',
+		*((mapping + '>\n', *processors, '\t</mapping>\n') if processors else (mapping + ' />\n',)),
+		"</scheduling>",
+	]
 
-	return tostring(scheduling, encoding="unicode", xml_declaration=True)
+	if out is None:
+		return "".join(parts)
+	else:
+		out.writelines(parts)
+
+		return ""
 
 
 @timed_callable("Formatting the solution to a raw string representation...")
@@ -159,14 +221,58 @@ def _raw_format(solution: Solution) -> str:
 	return str(solution)
 
 
-def _draw_scale(g: Element, length: int, x: int, y: int) -> Element:
-	"""Creates an XML element representing a scale bar of given length at a given position.
+def _escape_attrib(value: str) -> str:
+	"""Escapes a value to be written verbatim as a double-quoted XML attribute.
+
+	Parameters
+	----------
+	value : str
+		The value of an attribute.
+
+	Returns
+	-------
+	str
+		The escaped value.
+	"""
+
+	return value.translate(attrib_entities)
+
+
+@lru_cache(maxsize=8)
+def _get_scale_ticks(length: int, x: int) -> tuple[tuple[str, ...], tuple[tuple[str, str, str], ...]]:
+	"""Computes and caches the horizontal positions of the markers of a scale bar, which are the same for every core.
+
+	Parameters
+	----------
+	length : int
+		The length of the scale.
+	x : int
+		The horizontal position of the scale.
+
+	Returns
+	-------
+	small : tuple[str, ...]
+		The horizontal positions of the small markers.
+	big : tuple[tuple[str, str, str], ...]
+		The horizontal positions of the big markers, of their labels, and the labels themselves.
+	"""
+
+	small = tuple(str(x + 10 + (iii * 100)) for iii in range(0, length // 100))
+	big = tuple(
+		(str(x + 10 + (iii * 1000)), str(x + (iii * 1000) - 10), str(iii * 1000)) for iii in range(1, length // 1000)
+	)
+
+	return small, big
+
+
+def _draw_scale(parts: list[str], length: int, x: int, y: int) -> list[str]:
+	"""Writes the SVG elements representing a scale bar of given length at a given position.
 	The big markers are positioned at 0 and every multiple of 1000, and the small ones at every multiple of 100.
 
 	Parameters
 	----------
-	g : Element
-		An XML element to which the scale element will be added.
+	parts : list[str]
+		The parts of an SVG document, to which the scale bar will be appended.
 	length : int
 		The length of the scale.
 	x, y : int
@@ -174,121 +280,107 @@ def _draw_scale(g: Element, length: int, x: int, y: int) -> Element:
 
 	Returns
 	-------
-	g : Element
-		An XML element to which the scale bar have been appended.
+	parts : list[str]
+		The parts of the SVG document, to which the scale bar have been appended.
 	"""
 
-	for iii in range(0, int(length / 100)):
-		SubElement(g, "line", {
-			"x1": str(x + 10 + (iii * 100)), "y1": str(y + 40), "x2": str(x + 10 + (iii * 100)), "y2": str(y + 60),
-			"stroke": 'black',
-		})
+	small_ticks, big_ticks = _get_scale_ticks(length, x)
+	x_10, margin = f"{x + 10}", f"{x + length + 10}"
+	y_15, y_20, y_40, y_50, y_60, y_80 = f"{y + 15}", f"{y + 20}", f"{y + 40}", f"{y + 50}", f"{y + 60}", f"{y + 80}"
 
-	for iii in range(1, int(length / 1000)):
-		SubElement(g, "line", {
-			"x1": str(x + 10 + (iii * 1000)), "y1": str(y + 20), "x2": str(x + 10 + (iii * 1000)), "y2": str(y + 80),
-			"stroke": 'black',
-		})
-		SubElement(
-			g, "text", {"x": str(x + (iii * 1000) - 10), "y": str(y + 15), "fill": "black"},
-		).text = str(iii * 1000)
+	parts.extend(
+		f'\t\t<line x1="{tick_x}" y1="{y_40}" x2="{tick_x}" y2="{y_60}" stroke="black" />\n' for tick_x in small_ticks
+	)
 
-	SubElement(g, "line", {"x1": str(x + 10), "y1": str(y + 20), "x2": str(x + 10), "y2": str(y + 80), "stroke": 'black'})
+	for tick_x, label_x, label in big_ticks:
+		parts.append(f'\t\t<line x1="{tick_x}" y1="{y_20}" x2="{tick_x}" y2="{y_80}" stroke="black" />\n')
+		parts.append(f'\t\t<text x="{label_x}" y="{y_15}" fill="black">{label}</text>\n')
 
-	margin = str(x + length + 10)
+	parts.append(f'\t\t<line x1="{x_10}" y1="{y_20}" x2="{x_10}" y2="{y_80}" stroke="black" />\n')
+	parts.append(f'\t\t<line x1="{x_10}" y1="{y_50}" x2="{margin}" y2="{y_50}" stroke="black" />\n')
+	parts.append(f'\t\t<line x1="{margin}" y1="{y_20}" x2="{margin}" y2="{y_80}" stroke="black" />\n')
 
-	SubElement(g, "line", {
-		"x1": str(x + 10), "y1": str(y + 50), "x2": margin, "y2": str(y + 50), "stroke": 'black',
-	})
-	SubElement(g, "line", {"x1": margin, "y1": str(y + 20), "x2": margin, "y2": str(y + 80), "stroke": 'black'})
+	return parts
 
-	return g
 
-
-def _draw_core(g: Element, core: Core, x: int, y: int, h: int, w: int, hyperperiod: int, mapping: CoreJobMap,
-	colors: dict[Criticality, str]) -> Element:
-	"""Creates an XML element representing a core, with all the slices scheduled on it.
+def _draw_core(parts: list[str], core: Core, x: int, y: int, h: int, w: int, hyperperiod: int,
+	mapping: CoreJobMap) -> list[str]:
+	"""Writes the SVG elements representing a core, with all the slices scheduled on it.
 
 	Parameters
 	----------
-	g : Element
-		An XML element to which the core element will be added.
+	parts : list[str]
+		The parts of an SVG document, to which the core will be appended.
 	core : Core
 		A source core.
 	x, y, h, w : int
-		The dimensions of the XML element.
+		The dimensions of the SVG element.
 	hyperperiod : int
 		The hyperperiod.
 	mapping : CoreJobMap
 		A mapping of cores to a set of jobs.
-	colors : dict[Criticality, str]
-		A mapping of criticalities to colors.
 
 	Returns
 	-------
-	g : Element
-		An XML element to which the core have been appended.
+	parts : list[str]
+		The parts of the SVG document, to which the core have been appended.
 	"""
 
-	SubElement(g, "rect", {
-		"x": str(x), "y": str(y), "height": str(h), "width": str(w),
-		"rx": '10',
-		"fill": 'white',
-		"opacity": "0.8",
-	})
-	SubElement(g, "text", {"x": str(x + 10), "y": str(y + 20), "fill": "black"}).text = f"core: {core.id}"
-
-	if core in mapping:
-		for job in mapping[core]:
-			job_info: str = f"period: {job.task.period}\ndeadline: {job.task.deadline}\nwcet: {job.task.wcet}"
+	parts.append(f'\t\t<rect x="{x}" y="{y}" height="{h}" width="{w}" rx="10" fill="white" opacity="0.8" />\n')
+	parts.append(f'\t\t<text x="{x + 10}" y="{y + 20}" fill="black">core: {core.id}</text>\n')
+
+	jobs = mapping.get(core)
+
+	if jobs is not None:
+		x_10, x_15 = x + 10, x + 15
+		y_30, y_90 = f"{y + 30}", f"{y + 90}"
+
+		for job in jobs:
+			task = job.task
+			slice_count = len(job.execution)
+			color = colors[task.criticality]
+			title = escape(
+				f"App : {task.app.name}\nperiod: {task.period}\ndeadline: {task.deadline}\nwcet: {task.wcet}"
+				f"\nstart: {job.exec_window.start}\nstop: {job.exec_window.stop}",
+				quote=False,
+			)
+			label = f"T{task.id}-J{(job.sched_window.start // task.period) + 1}/{len(task)}-S"
+
 			for i, _slice in enumerate(job.execution):
-				slice_rect = SubElement(g, "rect", {
-					"x": str(x + 10 + _slice.start), "y": str(y + 30),
-					"height": "40", "width": str(len(_slice)),
-					"rx": '10',
-					"fill": colors[job.task.criticality],
-					"stroke": "black",
-				})
-				SubElement(
-					slice_rect,
-					"title",
-				).text = f"App : {job.task.app.name}\n{job_info}\nstart: {job.exec_window.start}\nstop: {job.exec_window.stop}"
-				SubElement(
-					g, "text", {"x": str(x + 15 + _slice.start), "y": str(y + 90), "fill": "black", "font-size": "smaller"},
-				).text = f"T{job.task.id}-J{int(job.sched_window.start / job.task.period) + 1}/{len(job.task)}-S{i + 1}/{len(job.execution)}"
-
-		_draw_scale(g, hyperperiod, x, y)
-
-	return g
+				parts.append(
+					f'\t\t<rect x="{x_10 + _slice.start}" y="{y_30}" height="40" width="{len(_slice)}" rx="10"'
+					f' fill="{color}" stroke="black">\n\t\t\t<title>{title}</title>\n\t\t</rect>\n'
+				)
+				parts.append(
+					f'\t\t<text x="{x_15 + _slice.start}" y="{y_90}" fill="black" font-size="smaller">'
+					f'{label}{i + 1}/{slice_count}</text>\n'
+				)
+
+		_draw_scale(parts, hyperperiod, x, y)
+
+	return parts
 
 
 @timed_callable("Formatting the solution to SVG...")
-def _svg_format(solution: Solution) -> str:
+def _svg_format(solution: Solution, out: Optional[TextIO] = None) -> str:
 	"""Formats a solution into SVG.
 
 	Parameters
 	----------
 	solution : Solution
 		A `Solution`.
+	out : Optional[TextIO], optional
+		A text stream to which the SVG is written, instead of being returned (default: None).
 
 	Returns
 	-------
 	str
-		A `str` representing a SVG `Solution`.
+		A `str` representing a SVG `Solution`, or an empty `str` if it has been written to `out`.
 	"""
 
-	register_namespace("", "http://www.w3.org/2000/svg")
-
 	hyperperiod = solution.problem.graph.hyperperiod
 	arch = solution.problem.arch
 
-	colors: dict[Criticality, str] = {
-		Criticality.sta_1: "green",
-		Criticality.sta_2: "yellow",
-		Criticality.sta_3: "orange",
-		Criticality.sta_4: "red",
-	}
-
 	title_margin_top = 30
 
 	# core
@@ -300,10 +392,9 @@ def _svg_format(solution: Solution) -> str:
 	# cpu
 	cpu_margin_top = title_margin_top + 30
 	cpu_height_margin = 60
-	cpu_y = list(accumulate(
-		(((len(cpu) * (core_height + core_margin_top)) + core_padding_top) + cpu_height_margin for cpu in arch),
-		initial=cpu_margin_top,
-	))
+	core_step = core_height + core_margin_top
+	cpu_heights = [(len(cpu) * core_step) + core_padding_top for cpu in arch]
+	cpu_y = list(accumulate((cpu_height + cpu_height_margin for cpu_height in cpu_heights), initial=cpu_margin_top))
 	cpu_width = core_width + 40
 	cpu_x = 30
 
@@ -312,54 +403,55 @@ def _svg_format(solution: Solution) -> str:
 	# img
 	img_width = cpu_width + 60
 	img_margin_bottom = 40
-	img_height = sum(
-		((len(cpu) * (core_height + core_margin_top)) + core_padding_top) + cpu_height_margin for cpu in arch
-	) + img_margin_bottom
-
-	svg = Element("svg", {"width": str(img_width), "height": str(img_height), "xmlns": 'http://www.w3.org/2000/svg'})
-
-	title = "Solution for " + solution.problem.config.filepaths.tsk.as_posix() + f"; score: {solution.score}, offsets sum: {solution.offset_sum}"
-
-	SubElement(svg, "title").text = title
-	SubElement(svg, "desc").text = "An horizontal chart bar showing the solution to the scheduling problem."
-
-	SubElement(svg, "rect", {"fill": 'url(#background)', "x": '0', "y": '0', "width": '100%', "height": '100%'})
-	SubElement(
-		svg, "text", {"x": '50%', "y": str(title_margin_top), "dominant-baseline": "middle", "text-anchor": "middle"},
-	).text = title
-
-	defs = SubElement(svg, "defs")
-
-	gradient = SubElement(defs, "linearGradient", id='background', y2='100%')
-	SubElement(gradient, "stop", {"offset": '5%', "stop-color": 'rgba(3,126,243,1)'})
-	SubElement(gradient, "stop", {"offset": '95%', "stop-color": 'rgba(48,195,158,1)'})
+	img_height = cpu_y[-1] - cpu_margin_top + img_margin_bottom
+
+	title = escape(
+		"Solution for " + solution.problem.config.filepaths.tsk.as_posix()
+		+ f"; score: {solution.score}, offsets sum: {solution.offset_sum}",
+		quote=False,
+	)
+
+	# the document is written as indented text directly, rather than built as a tree then serialized
+	parts: list[str] = [
+		"<?xml version='1.0' encoding='utf-8'?>\n",
+		f'<svg width="{img_width}" height="{img_height}" xmlns="http://www.w3.org/2000/svg">\n',
+		f"\t<title>{title}</title>\n",
+		"\t<desc>An horizontal chart bar showing the solution to the scheduling problem.</desc>\n",
+		'\t<rect fill="url(#background)" x="0" y="0" width="100%" height="100%" />\n',
+		f'\t<text x="50%" y="{title_margin_top}" dominant-baseline="middle" text-anchor="middle">{title}</text>\n',
+		"\t<defs>\n",
+		'\t\t<linearGradient id="background" y2="100%">\n',
+		'\t\t\t<stop offset="5%" stop-color="rgba(3,126,243,1)" />\n',
+		'\t\t\t<stop offset="95%" stop-color="rgba(48,195,158,1)" />\n',
+		"\t\t</linearGradient>\n",
+		"\t</defs>\n",
+		"\t<g>\n" if arch else "\t<g />\n",
+	]
+
+	for i, (cpu, cpu_height) in enumerate(zip(arch, cpu_heights)):
+		parts.append(
+			f'\t\t<rect x="{cpu_x}" y="{cpu_y[i]}" width="{cpu_width}" height="{cpu_height}" rx="20" fill="black"'
+			' opacity="0.5" />\n'
+		)
+		parts.append(f'\t\t<text x="{cpu_x + 20}" y="{cpu_y[i] + 30}" fill="white">cpu: {cpu.id}</text>\n')
 
-	g = SubElement(svg, "g")
+		# the cores are evenly spaced, so their ordinates form an arithmetic progression
+		core_y = range(cpu_y[i] + core_padding_top, cpu_y[i] + cpu_height, core_step)
 
-	for i, cpu in enumerate(arch):
-		cpu_height = (len(cpu) * (core_height + core_margin_top)) + core_padding_top
-		SubElement(
-			g,
-			"rect",
-			{
-				"x": str(cpu_x), "y": str(cpu_y[i]), "width": str(cpu_width), "height": str(cpu_height),
-				"rx": '20',
-				"fill": 'black',
-				"opacity": "0.5",
-			},
-		)
-		SubElement(g, "text", {"x": str(cpu_x + 20), "y": str(cpu_y[i] + 30), "fill": "white"}).text = f"cpu: {cpu.id}"
+		for core, y in zip(cpu, core_y):
+			_draw_core(parts, core, core_x, y, core_height, core_width, hyperperiod, solution.core_jobs)
 
-		core_y = list(accumulate((core_height + core_margin_top for core in cpu), initial=cpu_y[i] + core_padding_top))
+	if arch:
+		parts.append("\t</g>\n")
 
-		for ii, core in enumerate(cpu):
-			_draw_core(g, core, core_x, core_y[ii], core_height, core_width, hyperperiod, solution.core_jobs, colors)
+	parts.append("</svg>")
 
-	indent(svg, space="\t")
-	_svg = tostring(svg, encoding="unicode", xml_declaration=True)
-	#print(_svg)
+	if out is None:
+		return "".join(parts)
+	else:
+		out.writelines(parts)
 
-	return _svg
+		return ""
 
 
 # CLASSES #############################################################################################################
@@ -383,6 +475,11 @@ class OutputFormat(Enum):
 	-------
 	__call__
 		Converts the enumeration member into the corresponding function call.
+
+	Notes
+	-----
+	The formatters are wrapped in `partial` so that the enumeration keeps them as members rather than methods.
+	When formatting many solutions, bind `member.value` once and call it directly to skip the `__call__` dispatch.
 	"""
 
 	xml: partial = partial(_xml_format)
@@ -405,3 +502,35 @@ class OutputFormat(Enum):
 		"""
 
 		return self.value(solution)
+
+
+# DATA ################################################################################################################
+
+"""Maps the types that `SolutionEncoder` handles to their JSON representation."""
+encoders: dict[type, Callable[[Any], Any]] = {
+	Solution: lambda obj: {"schedule": {
+		"configuration": obj.problem.config.json(),
+		"hyperperiod": obj.problem.graph.hyperperiod,
+		"score": obj.score,
+		"core_jobs": {
+			f"cpu-{cpu_id}": {f"core-{core.id}": jobs for core, jobs in cores}
+			for cpu_id, cores in _group_core_jobs(obj.core_jobs)
+		},
+	}},
+	Job: lambda obj: {
+		"start": obj.exec_window.start,
+		"stop": obj.exec_window.stop,
+		"duration": obj.duration,
+		"app": obj.task.app.name,
+		"task": obj.task.id,
+	},
+	Path: str,
+}
+
+"""The colors of the slices, indexed by the criticality of their task."""
+colors: tuple[str, ...] = ("", "green", "yellow", "orange", "red")
+
+"""Translation table escaping the characters of XML attributes."""
+attrib_entities: dict[int, str] = str.maketrans({
+	"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "\r": "&#13;", "\n": "&#10;", "\t": "&#09;",
+})
@@ -10,11 +10,8 @@ from __future__ import annotations
 from collections.abc import Iterator, Reversible, Sequence, Set, Sized
 from dataclasses import dataclass, field
 from enum import IntEnum, unique
-from functools import cached_property, total_ordering
-from math import fsum
-from typing import overload
-
-from sortedcontainers import SortedSet  # type: ignore
+from functools import total_ordering
+from typing import Optional, overload
 
 
 # CLASSES #############################################################################################################
@@ -52,6 +49,8 @@ class Slice(Sized):
 		The stop time of the execution slice.
 	"""
 
+	__slots__ = ("job", "start", "stop")
+
 	job: Job
 	start: int
 	stop: int
@@ -69,7 +68,7 @@ class Slice(Sized):
 	# HASHABLE
 
 	def __hash__(self: Slice) -> int:
-		return hash(str(self.job) + str(self.start) + str(self.stop))
+		return hash((self.start, self.stop))
 
 	# TOTAL ORDERING
 
@@ -169,7 +168,7 @@ class Slice(Sized):
 		return f"<{self.job.short()}:{self.start} - {self.stop}>"
 
 
-@dataclass
+@dataclass(slots=True)
 @total_ordering
 class Job(Set, Reversible):
 	"""Represents an instance of a task.
@@ -183,14 +182,27 @@ class Job(Set, Reversible):
 	exec_window : slice
 		The window execution time, taking into account the offset and local deadline.
 	execution : list[Slice]
-		Set of execution slices.
+		Set of execution slices, sorted and not overlapping, so that only the first and last ones can leave the window.
+	_duration : Optional[int]
+		The cached duration of the execution slices, if computed.
+	_duration_execution : Optional[list[Slice]]
+		The execution slices the cached duration was computed for, so that replacing `execution` invalidates it.
+	_hash : int
+		The hash of the job, computed once at creation since its task and scheduling window never change.
 	"""
 
 	task: Task
 	sched_window: slice
 	exec_window: slice
 	execution: list[Slice] = field(default_factory=list)
+	_duration: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+	_duration_execution: Optional[list[Slice]] = field(default=None, init=False, repr=False, compare=False)
+	_hash: int = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self: Job) -> None:
+		self._hash = hash((self.task, self.sched_window.start, self.sched_window.stop))
 
+	@property
 	def duration(self: Job) -> int:
 		"""Computes and caches the duration of the slice.
 
@@ -205,7 +217,49 @@ class Job(Set, Reversible):
 			The duration of all the execution slices of the job.
 		"""
 
-		return sum((len(_slice) for _slice in self), start=0)
+		if self._duration is None or self._duration_execution is not self.execution:
+			self._duration = sum((len(_slice) for _slice in self), start=0)
+			self._duration_execution = self.execution
+
+		return self._duration
+
+	def clear_execution(self: Job) -> None:
+		"""Drops the execution slices of the job, along with their cached duration.
+
+		Parameters
+		----------
+		self : Job
+			The instance of `Job`.
+		"""
+
+		self.execution = []
+		self._duration = None
+		self._duration_execution = None
+
+	def clone(self: Job) -> Job:
+		"""Creates a copy of the job without its execution slices, the task and windows are shared.
+
+		Parameters
+		----------
+		self : Job
+			The instance of `Job`.
+
+		Returns
+		-------
+		Job
+			The copy of the job.
+		"""
+
+		result = Job.__new__(Job)
+		result.task = self.task
+		result.sched_window = self.sched_window
+		result.exec_window = self.exec_window
+		result.execution = []
+		result._duration = None
+		result._duration_execution = None
+		result._hash = self._hash
+
+		return result
 
 	def offset(self: Job) -> int:
 		"""Computes and returns the offset of the job.
@@ -223,7 +277,7 @@ class Job(Set, Reversible):
 
 		return self.exec_window.start - self.sched_window.start
 
-	@cached_property
+	@property
 	def local_deadline(self: Job) -> int:
 		"""Computes and returns the local deadline of the job.
 
@@ -254,7 +308,15 @@ class Job(Set, Reversible):
 			Returns `True` if at least one execution slice is out of the scheduling window, or `False` otherwise.
 		"""
 
-		return self.__len__() == 0 or self.has_deadline_miss() or self.has_offset_miss() or self.has_wcet_miss()
+		# inlined equivalent of `has_deadline_miss`, `has_offset_miss` and `has_wcet_miss`, as it runs for every job
+		# the slices are sorted, so checking the bounds of the first and last ones covers all of them
+		execution = self.execution
+		exec_window = self.exec_window
+
+		return (not execution
+			or execution[-1].stop > exec_window.stop
+			or execution[0].start < exec_window.start
+			or self.duration != self.task.wcet)
 
 	def has_deadline_miss(self: Job) -> bool:
 		"""Checks if the deadline of the job is missed.
@@ -291,7 +353,7 @@ class Job(Set, Reversible):
 		return self.execution[0].start < self.exec_window.start
 
 	def has_wcet_miss(self: Job) -> bool:
-		return self.duration() != self.task.wcet
+		return self.duration != self.task.wcet
 
 	def short(self: Job) -> str:
 		"""A short description of a job.
@@ -330,13 +392,13 @@ class Job(Set, Reversible):
 
 		return (f"{i}job {{{ii}"
 			f"task : {self.task.app.name} / {self.task.id};{ii}"
-			f"window : {self.sched_window} / {self.exec_window} / {self.duration()};{ii}"
+			f"window : {self.sched_window} / {self.exec_window} / {self.duration};{ii}"
 			f"execution {{" + "".join(f"{ii}\t{_slice.start} - {_slice.stop};" for _slice in self) + ii + "}" + i + "}")
 
 	# HASHABLE
 
 	def __hash__(self: Job) -> int:
-		return hash(str(self.task) + str(self.sched_window))
+		return self._hash
 
 	# TOTAL ORDERING
 
@@ -376,19 +438,13 @@ class Job(Set, Reversible):
 	# DEEPCOPY
 
 	def __deepcopy__(self: Job, memo: dict[int, object]) -> Job:
-		cls = self.__class__
-		result = cls.__new__(cls)
+		result = self.clone()
 		memo[id(self)] = result
 
-		result.task = self.task
-		result.sched_window = self.sched_window
-		result.exec_window = self.exec_window
-		result.execution = []
-
 		return result
 
 
-@dataclass
+@dataclass(slots=True)
 @total_ordering
 class Task(Set, Reversible):
 	"""Represents a task.
@@ -408,9 +464,13 @@ class Task(Set, Reversible):
 	criticality : Criticality
 		The criticality level, [0; 4].
 	parent : Task
-		A list of tasks to be completed before starting.
+		The task to be completed before starting, if any.
 	jobs : list[Job]
 		A set of n instances of the task, with n = int(wcet / hyperperiod).
+	workload : float
+		The workload of the task, computed once at creation.
+	_hash : int
+		The hash of the task, computed once at creation since its id and app never change.
 	"""
 
 	id: int
@@ -421,23 +481,12 @@ class Task(Set, Reversible):
 	criticality: Criticality
 	parent: Task
 	jobs: list[Job] = field(default_factory=list)
+	workload: float = field(init=False, repr=False, compare=False)
+	_hash: int = field(init=False, repr=False, compare=False)
 
-	@cached_property
-	def workload(self: Task) -> float:
-		"""Computes and caches the workload of the task.
-
-		Parameters
-		----------
-		self : Task
-			The instance of `Task`.
-
-		Returns
-		-------
-		float
-			The workload of the task.
-		"""
-
-		return self.wcet / self.period
+	def __post_init__(self: Task) -> None:
+		self.workload = self.wcet / self.period
+		self._hash = hash((self.id, self.app.name))
 
 	def short(self: Task) -> str:
 		"""A short description of a task.
@@ -487,7 +536,7 @@ class Task(Set, Reversible):
 	# HASHABLE
 
 	def __hash__(self: Task) -> int:
-		return hash(str(self.id) + self.app.name)
+		return self._hash
 
 	# TOTAL ORDERING
 
@@ -525,7 +574,7 @@ class Task(Set, Reversible):
 		return self.jobs.__iter__()
 
 
-@dataclass
+@dataclass(slots=True)
 @total_ordering
 class App(Sequence, Reversible):
 	"""An application.
@@ -538,13 +587,19 @@ class App(Sequence, Reversible):
 		Whether or not the order of tasks is significant. Could also be obtained by `self.tasks[:-1].parent is not None`.
 	tasks : list[Task]
 		The tasks within the Application.
+	_criticality : Optional[Criticality]
+		The cached maximal criticality within the tasks, if computed.
+	_workload : Optional[float]
+		The cached workload of the tasks, if computed.
 	"""
 
 	name: str
 	order: bool
 	tasks: list[Task] = field(default_factory=list)
+	_criticality: Optional[Criticality] = field(default=None, init=False, repr=False, compare=False)
+	_workload: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
-	@cached_property
+	@property
 	def criticality(self: App) -> Criticality:
 		"""Computes and caches the maximal criticality, [0; 4], within the tasks.
 		We could also just return it from the first task in `tasks`.
@@ -560,9 +615,12 @@ class App(Sequence, Reversible):
 			The maximal criticality within `self.tasks`, assuming a non-empty list of tasks.
 		"""
 
-		return max(self, key=lambda task: task.criticality).criticality
+		if self._criticality is None:
+			self._criticality = max(task.criticality for task in self)
+
+		return self._criticality
 
-	@cached_property
+	@property
 	def workload(self: App) -> float:
 		"""Computes and caches the workload of the tasks.
 
@@ -577,7 +635,10 @@ class App(Sequence, Reversible):
 			The workload of the app.
 		"""
 
-		return fsum(task.workload for task in self)
+		if self._workload is None:
+			self._workload = sum(task.workload for task in self)
+
+		return self._workload
 
 	def pformat(self: App, level: int = 0) -> str:
 		"""A complete description of an application.
@@ -664,12 +725,18 @@ class Graph(Set, Reversible):
 		The applications to schedule.
 	hyperperiod : int
 		The hyperperiod length for this `Graph`, the least common divisor of the periods of all tasks.
+	_max_criticality : Optional[Criticality]
+		The cached maximal criticality within the apps, if computed.
+	_tasks : Optional[list[Task]]
+		The cached flattened list of the tasks within the apps, if computed.
 	"""
 
 	apps: list[App]
 	hyperperiod: int
+	_max_criticality: Optional[Criticality] = field(default=None, init=False, repr=False, compare=False)
+	_tasks: Optional[list[Task]] = field(default=None, init=False, repr=False, compare=False)
 
-	@cached_property
+	@property
 	def max_criticality(self: Graph) -> Criticality:
 		"""Computes and caches the maximal criticality within the apps.
 
@@ -684,7 +751,30 @@ class Graph(Set, Reversible):
 			The maximal criticality within `self.apps`, assuming a non-empty list of applications.
 		"""
 
-		return max(self, key=lambda app: app.criticality).criticality
+		if self._max_criticality is None:
+			self._max_criticality = max(app.criticality for app in self)
+
+		return self._max_criticality
+
+	@property
+	def tasks(self: Graph) -> list[Task]:
+		"""Computes and caches the flattened list of the tasks within the apps.
+
+		Parameters
+		----------
+		self : Graph
+			The instance of `Graph`.
+
+		Returns
+		-------
+		list[Task]
+			The tasks of all the apps, in order.
+		"""
+
+		if self._tasks is None:
+			self._tasks = [task for app in self for task in app]
+
+		return self._tasks
 
 	def pformat(self: Graph, level: int = 0) -> str:
 		"""A complete description of a graph.
@@ -276,11 +276,11 @@ def _wrapper(config: Configuration) -> str:
 
 	problem = build(config)
 	solutions = solve(problem)
+	formatter = OutputFormat['svg'].value
 
 	for i, solution in enumerate(solutions):
-		file = open(f"output/{i}.svg", 'w')
-		file.write(OutputFormat['svg'](solution))
-		file.close()
+		with open(f"output/{i}.svg", 'w') as file:
+			formatter(solution, out=file)
 
 	return problem
 
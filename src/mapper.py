@@ -4,17 +4,15 @@
 # IMPORTS #############################################################################################################
 
 from collections import defaultdict
-from queue import PriorityQueue
+from heapq import heappop, heappush
 from random import choice, sample
 
 from algorithm import SchedAlgorithm
 
-from arch_model import Architecture, Core, CoreJobMap
+from arch_model import Architecture, Core, CoreJobMap, Processor
 
 from graph_model import App, Graph, Task
 
-from sortedcontainers import SortedSet  # type: ignore
-
 
 Alteration = dict[App, dict[Core, set[Task]]]
 
@@ -47,13 +45,28 @@ def _print_alteration_possibilities(possibilities: Alteration) -> None:
 				print("\t\t" + task.short())
 
 
-def _get_core(arch: Architecture, task: Task) -> Core:
+def _get_task_cores(arch: Architecture) -> dict[Task, Core]:
+	"""Indexes the cores by the tasks mapped on them, so that finding the core of a task does not scan the architecture.
+
+	Parameters
+	----------
+	arch : Architecture
+		An architecture whose cores have been mapped tasks.
+
+	Returns
+	-------
+	task_cores : dict[Task, Core]
+		A mapping of tasks to the first core they are mapped on.
+	"""
+
+	task_cores: dict[Task, Core] = {}
+
 	for cpu in arch:
 		for core in cpu:
-			if task in core.tasks:
-				return core
+			for task in core.tasks:
+				task_cores.setdefault(task, core)
 
-	raise RuntimeError(f"Could not find {task.short()} in the mapping.")
+	return task_cores
 
 
 def _swap_tasks(possibilities: Alteration, app: App, cores: list[Core], task0: Task, task1: Task, neighbor: CoreJobMap) -> None:
@@ -85,12 +98,16 @@ def _swap_tasks(possibilities: Alteration, app: App, cores: list[Core], task0: T
 
 def get_alteration_possibilities(arch: Architecture, graph: Graph) -> Alteration:
 	possibilities: Alteration = {}
+	task_cores = _get_task_cores(arch)
 
 	for app in filter(lambda app: len(app) >= 2, graph):
 		cores: dict[Core, set[Task]] = defaultdict(set)
 
 		for task in app:
-			cores[_get_core(arch, task)].add(task)
+			if (core := task_cores.get(task)) is None:
+				raise RuntimeError(f"Could not find {task.short()} in the mapping.")
+
+			cores[core].add(task)
 
 		if len(cores) >= 2:
 			possibilities[app] = cores
@@ -124,7 +141,7 @@ def alter_mapping(possibilities: Alteration, algorithm: SchedAlgorithm, neighbor
 	return algorithm.core_scheduling_check(cores[0]) and algorithm.core_scheduling_check(cores[1])
 
 
-def mapping(arch: Architecture, apps: SortedSet[App], algorithm: SchedAlgorithm) -> CoreJobMap:
+def mapping(arch: Architecture, apps: list[App], algorithm: SchedAlgorithm) -> CoreJobMap:
 	"""Creates and returns a solution from the relaxed problem.
 
 	Parameters
@@ -143,23 +160,25 @@ def mapping(arch: Architecture, apps: SortedSet[App], algorithm: SchedAlgorithm)
 		If an application cannot be scheduled on the least busy processor.
 	"""
 
-	cpu_pqueue: PriorityQueue = PriorityQueue(maxsize=len(arch))
+	# the mapping is single-threaded, so a plain heap replaces the locking `PriorityQueue`
+	cpu_heap: list[Processor] = []
 
+	# pushed one by one rather than heapified, so that equally loaded processors are picked in order
 	for cpu in arch:
-		cpu_pqueue.put(cpu)
+		heappush(cpu_heap, cpu)
 
 	for app in apps:
-		cpu = cpu_pqueue.get()
+		cpu = heappop(cpu_heap)
 
 		if not cpu.apps or (result := algorithm.local_scheduling_check(cpu, app, algorithm.security_margin)) is None:
-			cpu.apps.add(app)
+			cpu.apps.append(app)
 
 			for task in app:
 				cpu.min_core().tasks.append(task)
 		else:
 			raise RuntimeError(f"Initial mapping failed with app '{app.name}' on CPU '{cpu.id}': {result}.")
 
-		cpu_pqueue.put(cpu)
+		heappush(cpu_heap, cpu)
 
 	core_jobs = {}
 
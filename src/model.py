@@ -5,10 +5,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from functools import cached_property, total_ordering
+from dataclasses import dataclass, field
+from functools import total_ordering
 from pathlib import Path
-from typing import NamedTuple, Union
+from typing import NamedTuple, Optional, Union
 
 from algorithm import SchedAlgorithm
 
@@ -205,6 +205,10 @@ class Solution:
 		The score of a Solution regarding an objective function.
 	core_jobs : CoreJobMap
 		A mapping between cores and jobs.
+	_score : Optional[Score]
+		The cached score, if computed.
+	_offset_sum : Optional[int]
+		The cached sum of the offsets of the jobs, if computed.
 	"""
 
 	problem: Problem
@@ -212,8 +216,10 @@ class Solution:
 	objective: Objective
 	algorithm: SchedAlgorithm
 	possibilities: Alteration
+	_score: Optional[Score] = field(default=None, init=False, repr=False, compare=False)
+	_offset_sum: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
-	@cached_property
+	@property
 	def score(self: Solution) -> Score:
 		"""The score of the solution.
 
@@ -228,11 +234,17 @@ class Solution:
 			The score of the solution.
 		"""
 
-		return self.objective(self)
+		if self._score is None:
+			self._score = self.objective(self)
 
-	@cached_property
+		return self._score
+
+	@property
 	def offset_sum(self: Solution) -> int:
-		return sum(job.offset() for jobs in self.core_jobs.values() for job in jobs)
+		if self._offset_sum is None:
+			self._offset_sum = sum(job.offset() for jobs in self.core_jobs.values() for job in jobs)
+
+		return self._offset_sum
 
 	def pformat(self: Solution, level: int = 0) -> str:
 		"""A complete description of a solution.
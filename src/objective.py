@@ -5,8 +5,10 @@
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
-from operator import gt, lt
+from itertools import pairwise
+from operator import attrgetter, gt, lt
 from statistics import variance
 from typing import Callable, Union
 
@@ -21,17 +23,11 @@ def cumulated_empty_space(solution: Solution) -> Score:
 	hyperperiod = solution.problem.graph.hyperperiod
 
 	for jobs in solution.core_jobs.values():
-		core_run_time = 0
+		slices = sorted((_slice for job in jobs for _slice in job), key=attrgetter("start"))
 
-		slices = sorted(_slice for job in jobs for _slice in job)
-
-		for i in range(len(slices) - 1):
-			core_run_time += len(slices[i])
-
-			if slices[i].job.task.criticality != slices[i + 1].job.task.criticality:
-				core_run_time += switch_time
-
-		core_run_time += len(slices[len(slices) - 1])
+		core_run_time = sum(map(len, slices)) + switch_time * sum(
+			previous.job.task.criticality != current.job.task.criticality for previous, current in pairwise(slices)
+		)
 
 		idle += hyperperiod - core_run_time
 
@@ -44,20 +40,20 @@ def normal_distr_empty_space(solution: Solution) -> Score:
 	hyperperiod = solution.problem.graph.hyperperiod
 
 	for jobs in solution.core_jobs.values():
-		if slices := sorted(_slice for job in jobs for _slice in job):
+		if slices := sorted((_slice for job in jobs for _slice in job), key=attrgetter("start")):
 			# first : space before
 			idle_slices.append(slices[0].start)
 
 			# spaces in between
-			for i in range(len(slices) - 1):
-				idle_slices.append(slices[i + 1].start - slices[i].stop)
+			idle_slices.extend(current.start - previous.stop for previous, current in pairwise(slices))
 
 			# last : space after
-			idle_slices.append(hyperperiod - slices[len(slices) - 1].stop)
+			idle_slices.append(hyperperiod - slices[-1].stop)
 
-	print(idle_slices, int(variance(idle_slices)))
+	score = variance(idle_slices)
+	logging.debug("idle slices: %s, variance: %d", idle_slices, int(score))
 
-	return variance(idle_slices)
+	return score
 
 
 # not working properly
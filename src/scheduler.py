@@ -3,7 +3,8 @@
 
 # IMPORTS #############################################################################################################
 
-from itertools import groupby
+from itertools import groupby, pairwise
+from operator import attrgetter
 
 from algorithm import SchedAlgorithm
 
@@ -11,8 +12,6 @@ from arch_model import CoreJobMap, Core
 
 from graph_model import Job, Slice
 
-from sortedcontainers import SortedSet  # type: ignore
-
 
 # FUNCTIONS ###########################################################################################################
 
@@ -42,7 +41,7 @@ def _check_no_intersect(slices: list[Slice]) -> None:
 				raise RuntimeError(f"slices '{slices[i]}' and '{slices[ii]}' are not disjoint.")
 
 
-def _get_intersecting_slices(target_job: Job, jobs: SortedSet[Job]) -> list[Slice]:
+def _get_intersecting_slices(target_job: Job, jobs: list[Job]) -> list[Slice]:
 	"""Creates a list of slices from a set of jobs intersecting with the scheduling window of a job.
 
 	Parameters
@@ -82,7 +81,7 @@ def _get_intersecting_slices(target_job: Job, jobs: SortedSet[Job]) -> list[Slic
 
 	_check_no_intersect(slices)  # check that the intersecting slices do not intersect between themselves
 
-	return sorted(slices, key=lambda s: s.stop)
+	return sorted(slices, key=attrgetter("stop"))
 
 
 def _consume_leading_space(job: Job, first: Slice, wcet: int, switch_time: int) -> tuple[int, list[Slice]]:
@@ -113,15 +112,15 @@ def _consume_leading_space(job: Job, first: Slice, wcet: int, switch_time: int)
 def _consume_space(job: Job, slices: list[Slice], job_slices: list[Slice], remaining: int, switch_time: int) -> tuple[int, list[Slice]]:
 	#print("\n" + ("\t" * 3) + "_consume_space")
 
-	for i in range(len(slices) - 1):
-		if 0 < (space := slices[i + 1].start - slices[i].stop) and slices[i].stop < slices[i + 1].start:
-			start = slices[i].stop
+	for previous, following in pairwise(slices):
+		if 0 < (space := following.start - previous.stop) and previous.stop < following.start:
+			start = previous.stop
 
-			if job.task.criticality != slices[i].job.task.criticality:
+			if job.task.criticality != previous.job.task.criticality:
 				start += switch_time
 				space -= switch_time
 
-			if job.task.criticality != slices[i + 1].job.task.criticality:
+			if job.task.criticality != following.job.task.criticality:
 				space -= switch_time
 
 			if space > 0:
@@ -156,15 +155,15 @@ def _consume_trailing_space(job: Job, last: Slice, job_slices: list[Slice], rema
 	return job_slices
 
 
-def _get_slices(job: Job, jobs: SortedSet[Job], switch_time: int) -> list[Slice]:
+def _get_slices(job: Job, jobs: list[Job], switch_time: int) -> list[Slice]:
 	"""Gets the slices those total time is equal to the WCET of a job and that do not intersect with a set of jobs.
 
 	Parameters
 	----------
 	job : Job
 		A job to get execution slices for.
-	jobs : SortedSet[Job]
-		A set of jobs.
+	jobs : list[Job]
+		A list of jobs.
 
 	Returns
 	-------
@@ -241,7 +240,7 @@ def _generate_exec_slices(job: Job, slices: list[Slice]) -> list[Slice]:
 		print("\t" * 4 + str(_slice))
 	"""
 
-	return sorted(job_slices, key=lambda s: s.stop)
+	return sorted(job_slices, key=attrgetter("stop"))
 
 # ENTRY POINT #########################################################################################################
 
@@ -271,13 +270,17 @@ def schedule(core_jobs: CoreJobMap, algorithm: SchedAlgorithm, switch_time: int)
 
 	for jobs in core_jobs.values():
 		for job in jobs:
-			job.execution = []
+			job.clear_execution()
 
-	for jobs in core_jobs.values():
-		_key = lambda j: j.task.criticality
+	_key = attrgetter("task.criticality")
+	_deadline = attrgetter("exec_window.stop")
 
+	for jobs in core_jobs.values():
 		for _crit, _jobs in groupby(sorted(jobs, key=_key, reverse=True), key=_key):
-			for job in sorted(algorithm(_jobs), key=lambda j: j.exec_window.stop):
+			ordered_jobs = algorithm(_jobs)
+			ordered_jobs.sort(key=_deadline)  # in place, linear on the already ordered output of EDF
+
+			for job in ordered_jobs:
 				slices = _get_slices(job, jobs, switch_time)
 				"""
 				print("\t" * 2 + f"exec slices ({len(slices)}) :")
@@ -4,7 +4,6 @@
 # IMPORTS #############################################################################################################
 
 import logging
-from copy import deepcopy
 from typing import Optional
 
 from algorithm import algorithms
@@ -41,10 +40,8 @@ def _is_feasible(graph: Graph, core_jobs: CoreJobMap) -> bool:
 		Returns `True` is all constraints holds, or `False` otherwise.
 	"""
 
-	for jobs in core_jobs.values():
-		for job in jobs:
-			if job.has_execution_miss():
-				return False
+	if any(job.has_execution_miss() for jobs in core_jobs.values() for job in jobs):
+		return False
 
 	"""
 	for app in filter(lambda a: a.order, graph):
@@ -59,9 +56,9 @@ def _is_feasible(graph: Graph, core_jobs: CoreJobMap) -> bool:
 
 
 def _try_generate_neighbor(source: Solution, core: Core, job: Job, job_index: int) -> Optional[Solution]:
-	print("\t\t_try_generate_neighbor")
+	logging.debug("_try_generate_neighbor")
 
-	neighbor: CoreJobMap = {deepcopy(core): deepcopy(jobs) for core, jobs in source.core_jobs.items()}
+	neighbor: CoreJobMap = {core.clone(): [_job.clone() for _job in jobs] for core, jobs in source.core_jobs.items()}
 	initial_step = source.problem.config.params.initial_step
 	switch_time = source.problem.config.params.switch_time
 
@@ -100,7 +97,7 @@ def get_neighbors(solution: Solution) -> list[Solution]:
 		A list of candidates, may be empty.
 	"""
 
-	print("\tget_neighbors")
+	logging.debug("get_neighbors")
 
 	candidates: list[Solution] = []
 	initial_step = solution.problem.config.params.initial_step
@@ -117,7 +114,7 @@ def get_neighbors(solution: Solution) -> list[Solution]:
 
 
 def _optimise(initial_solution: Solution) -> list[list[Solution]]:
-	print("_optimize")
+	logging.debug("_optimise")
 
 	explored_domain: list[list[Solution]] = [[]]
 	explored_domain[0].append(initial_solution)